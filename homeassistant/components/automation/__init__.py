@@ -576,7 +576,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                 referenced |= condition.async_extract_devices(conf)
 
         for conf in self._trigger_config:
-            referenced |= set(_trigger_extract_devices(conf))
+            referenced.update(_trigger_extract_devices(conf))
 
         return referenced
 
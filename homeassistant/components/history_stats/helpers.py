@@ -17,6 +17,10 @@ _LOGGER = logging.getLogger(__name__)
 DURATION_START = "start"
 DURATION_END = "end"
 
+# Raised when the template references an entity that is not yet available
+# during startup; not worth logging as an error.
+_UNDEFINED_NONE_PREFIX = "UndefinedError: 'None' has no attribute"
+
 
 @callback
 def async_calculate_period(
@@ -39,9 +43,7 @@ def async_calculate_period(
         try:
             rendered = template.async_render()
         except (TemplateError, TypeError) as ex:
-            if ex.args and not ex.args[0].startswith(
-                "UndefinedError: 'None' has no attribute"
-            ):
+            if ex.args and not ex.args[0].startswith(_UNDEFINED_NONE_PREFIX):
                 _LOGGER.error("Error parsing template for field %s", bound, exc_info=ex)
             raise
         if isinstance(rendered, str):
@@ -251,6 +251,7 @@ class BinarySensorTemplate(TemplateEntity, BinarySensorEntity, RestoreEntity):
         self._attr_device_class = config.get(CONF_DEVICE_CLASS)
         self._template = config[CONF_STATE]
         self._delay_cancel = None
+        self._delay_state = None
         self._delay_on = None
         self._delay_on_raw = config.get(CONF_DELAY_ON)
         self._delay_off = None
@@ -297,16 +298,20 @@ class BinarySensorTemplate(TemplateEntity, BinarySensorEntity, RestoreEntity):
     def _update_state(self, result):
         super()._update_state(result)
 
-        if self._delay_cancel:
-            self._delay_cancel()
-            self._delay_cancel = None
-
         state = (
             None
             if isinstance(result, TemplateError)
             else template.result_as_boolean(result)
         )
 
+        if self._delay_cancel:
+            if state == self._delay_state:
+                # A delay is already counting down to this state, keep it
+                # running instead of restarting the delay window.
+                return
+            self._delay_cancel()
+            self._delay_cancel = None
+
         if state == self._attr_is_on:
             return
 
@@ -323,10 +328,12 @@ class BinarySensorTemplate(TemplateEntity, BinarySensorEntity, RestoreEntity):
         def _set_state(_):
             """Set state of template binary sensor."""
             self._attr_is_on = state
+            self._delay_cancel = None
             self.async_write_ha_state()
 
         delay = (self._delay_on if state else self._delay_off).total_seconds()
         # state with delay. Cancelled if template result changes.
+        self._delay_state = state
         self._delay_cancel = async_call_later(self.hass, delay, _set_state)
 
 
@@ -50,6 +50,9 @@ from .template_entity import (
 _LOGGER = logging.getLogger(__name__)
 _VALID_STATES = [STATE_ON, STATE_OFF, "true", "false"]
 
+# Strip brackets and whitespace from rendered color strings in one pass
+_COLOR_CLEANUP_TABLE = str.maketrans("", "", "()[] ")
+
 # Legacy
 CONF_COLOR_ACTION = "set_color"
 CONF_COLOR_TEMPLATE = "color_template"
@@ -835,9 +838,7 @@ class LightTemplate(TemplateEntity, LightEntity):
             if render in ("None", ""):
                 self._rgb_color = None
                 return
-            cleanup_char = ["(", ")", "[", "]", " "]
-            for char in cleanup_char:
-                render = render.replace(char, "")
+            render = render.translate(_COLOR_CLEANUP_TABLE)
             r_int, g_int, b_int = map(int, render.split(",", 3))
         elif isinstance(render, (list, tuple)) and len(render) == 3:
             r_int, g_int, b_int = render
@@ -880,9 +881,7 @@ class LightTemplate(TemplateEntity, LightEntity):
             if render in ("None", ""):
                 self._rgb_color = None
                 return
-            cleanup_char = ["(", ")", "[", "]", " "]
-            for char in cleanup_char:
-                render = render.replace(char, "")
+            render = render.translate(_COLOR_CLEANUP_TABLE)
             r_int, g_int, b_int, w_int = map(int, render.split(",", 4))
         elif isinstance(render, (list, tuple)) and len(render) == 4:
             r_int, g_int, b_int, w_int = render
@@ -926,9 +925,7 @@ class LightTemplate(TemplateEntity, LightEntity):
             if render in ("None", ""):
                 self._rgb_color = None
                 return
-            cleanup_char = ["(", ")", "[", "]", " "]
-            for char in cleanup_char:
-                render = render.replace(char, "")
+            render = render.translate(_COLOR_CLEANUP_TABLE)
             r_int, g_int, b_int, cw_int, ww_int = map(int, render.split(",", 5))
         elif isinstance(render, (list, tuple)) and len(render) == 5:
             r_int, g_int, b_int, cw_int, ww_int = render
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from collections.abc import Callable, Mapping
 import contextlib
-import itertools
 import logging
 from typing import Any, cast
 
@@ -136,16 +135,15 @@ def rewrite_common_legacy_to_modern_conf(
     if extra_legacy_fields is None:
         extra_legacy_fields = {}
 
-    for from_key, to_key in itertools.chain(
-        LEGACY_FIELDS.items(), extra_legacy_fields.items()
-    ):
-        if from_key not in entity_cfg or to_key in entity_cfg:
-            continue
+    for fields in (LEGACY_FIELDS, extra_legacy_fields):
+        for from_key, to_key in fields.items():
+            if from_key not in entity_cfg or to_key in entity_cfg:
+                continue
 
-        val = entity_cfg.pop(from_key)
-        if isinstance(val, str):
-            val = Template(val, hass)
-        entity_cfg[to_key] = val
+            val = entity_cfg.pop(from_key)
+            if isinstance(val, str):
+                val = Template(val, hass)
+            entity_cfg[to_key] = val
 
     if CONF_NAME in entity_cfg and isinstance(entity_cfg[CONF_NAME], str):
         entity_cfg[CONF_NAME] = Template(entity_cfg[CONF_NAME], hass)
@@ -153,9 +151,33 @@ def rewrite_common_legacy_to_modern_conf(
     return entity_cfg
 
 
+class _DummyState(State):
+    """None-state for template entities not yet added to the state machine."""
+
+    def __init__(self) -> None:
+        """Initialize a new state."""
+        super().__init__("unknown.unknown", STATE_UNKNOWN)
+        self.entity_id = None  # type: ignore[assignment]
+
+    @under_cached_property
+    def name(self) -> str:
+        """Name of this state."""
+        return "<None>"
+
+
 class _TemplateAttribute:
     """Attribute value linked to template result."""
 
+    __slots__ = (
+        "_entity",
+        "_attribute",
+        "template",
+        "validator",
+        "on_update",
+        "async_update",
+        "none_on_template_error",
+    )
+
     def __init__(
         self,
         entity: Entity,
@@ -270,7 +292,6 @@ class TemplateEntity(Entity):  # pylint: disable=hass-enforce-class-module
         """Template Entity."""
         self._template_attrs: dict[Template, list[_TemplateAttribute]] = {}
         self._template_result_info: TrackTemplateResultInfo | None = None
-        self._attr_extra_state_attributes = {}
         self._self_ref_update_count = 0
         self._attr_unique_id = unique_id
         self._preview_callback: (
@@ -302,20 +323,7 @@ class TemplateEntity(Entity):  # pylint: disable=hass-enforce-class-module
             self._run_variables = config.get(CONF_VARIABLES, {})
             self._blueprint_inputs = config.get("raw_blueprint_inputs")
 
-        class DummyState(State):
-            """None-state for template entities not yet added to the state machine."""
-
-            def __init__(self) -> None:
-                """Initialize a new state."""
-                super().__init__("unknown.unknown", STATE_UNKNOWN)
-                self.entity_id = None  # type: ignore[assignment]
-
-            @under_cached_property
-            def name(self) -> str:
-                """Name of this state."""
-                return "<None>"
-
-        variables = {"this": DummyState()}
+        variables = {"this": _DummyState()}
 
         # Try to render the name as it can influence the entity ID
         self._attr_name = fallback_name
@@ -371,6 +379,10 @@ class TemplateEntity(Entity):  # pylint: disable=hass-enforce-class-module
         self, attribute_key: str, attribute_template: Template
     ) -> None:
         """Create a template tracker for the attribute."""
+        # Only allocate the attributes dict for entities that have
+        # attribute templates; most template entities have none.
+        if not hasattr(self, "_attr_extra_state_attributes"):
+            self._attr_extra_state_attributes = {}
 
         def _update_attribute(result: str | TemplateError) -> None:
             attr_result = None if isinstance(result, TemplateError) else result
@@ -453,8 +465,11 @@ class TemplateEntity(Entity):  # pylint: disable=hass-enforce-class-module
                 )
             return
 
+        # Resolve the lookup once; this loop runs for every state change
+        # routed to the entity.
+        template_attrs = self._template_attrs
         for update in updates:
-            for template_attr in self._template_attrs[update.template]:
+            for template_attr in template_attrs[update.template]:
                 template_attr.handle_result(
                     event, update.template, update.last_result, update.result
                 )
@@ -293,7 +293,13 @@ def async_track_state_change(
         # the entity_id does not match since usually
         # only one or two listeners want that specific
         # entity_id.
-        return async_track_state_change_event(hass, entity_ids, state_change_listener)
+        #
+        # The entity_ids are already lower cased above so
+        # we can use the internal helper directly and avoid
+        # rebuilding the collection a second time.
+        return _async_track_state_change_event(
+            hass, entity_ids, state_change_listener, None
+        )
 
     return hass.bus.async_listen(
         EVENT_STATE_CHANGED,
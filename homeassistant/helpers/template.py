@@ -567,14 +567,15 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        env = self._env
+        if compiled := env.template_cache.get(self.template):
             self._compiled_code = compiled
             return
 
         with _template_context_manager as cm:
             cm.set_template(self.template, "compiling")
             try:
-                self._compiled_code = self._env.compile(self.template)
+                self._compiled_code = env.compile(self.template)
             except jinja2.TemplateError as err:
                 raise TemplateError(err) from err
 
@@ -741,7 +742,8 @@ class Template:
             )
 
         if self.is_static:
-            render_info._result = self.template.strip()  # noqa: SLF001
+            # self.template is stripped in __init__
+            render_info._result = self.template  # noqa: SLF001
             render_info._freeze_static()  # noqa: SLF001
             return render_info
 
@@ -1286,6 +1288,9 @@ def result_as_boolean(template_result: Any | None) -> bool:
     if template_result is None:
         return False
 
+    if isinstance(template_result, bool):
+        return template_result
+
     return forgiving_boolean(template_result, default=False)
 
 
@@ -12,10 +12,7 @@ from timeit import default_timer as timer
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.event import (
-    async_track_state_change,
-    async_track_state_change_event,
-)
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.json import JSON_DUMP
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -121,19 +118,29 @@ async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
     count = 0
     entity_id = "light.kitchen"
-    event = asyncio.Event()
+    done = asyncio.Event()
 
     @core.callback
-    def listener(*args):
+    def listener(event: core.Event) -> None:
         """Handle event."""
         nonlocal count
+
+        if (
+            (old_state := event.data["old_state"]) is None
+            or old_state.state != "off"
+            or (new_state := event.data["new_state"]) is None
+            or new_state.state != "on"
+        ):
+            return
+
         count += 1
 
         if count == 10**6:
-            event.set()
+            done.set()
 
-    for idx in range(1000):
-        async_track_state_change(hass, f"{entity_id}{idx}", listener, "off", "on")
+    async_track_state_change_event(
+        hass, [f"{entity_id}{idx}" for idx in range(1000)], listener
+    )
     event_data = {
         "entity_id": f"{entity_id}0",
         "old_state": core.State(entity_id, "off"),
@@ -145,7 +152,7 @@ async def state_changed_helper(hass):
 
     start = timer()
 
-    await event.wait()
+    await done.wait()
 
     return timer() - start
 
@@ -606,6 +606,71 @@ async def test_template_delay_on_off(hass: HomeAssistant) -> None:
     assert hass.states.get("binary_sensor.test_off").state == STATE_OFF
 
 
+@pytest.mark.parametrize(
+    ("config", "count", "domain"),
+    [
+        (
+            {
+                "binary_sensor": {
+                    "platform": "template",
+                    "sensors": {
+                        "test": {
+                            "friendly_name": "virtual thingy",
+                            "value_template": "{{ states('sensor.test_state') }}",
+                            "device_class": "motion",
+                            "delay_on": 5,
+                        },
+                    },
+                },
+            },
+            1,
+            binary_sensor.DOMAIN,
+        ),
+    ],
+)
+@pytest.mark.usefixtures("start_ha")
+async def test_template_delay_on_keeps_running_timer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a changed result with the same target state keeps the delay."""
+    hass.states.async_set("sensor.test_state", STATE_OFF)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.test").state == STATE_OFF
+
+    # A truthy raw result starts the delay window
+    hass.states.async_set("sensor.test_state", "yes")
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.test").state == STATE_OFF
+
+    # A different truthy raw result inside the window must not restart it
+    freezer.tick(timedelta(seconds=3))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.test_state", STATE_ON)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.test").state == STATE_OFF
+
+    # The original deadline still applies
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.test").state == STATE_ON
+
+    # The next off -> on transition schedules a fresh delay
+    hass.states.async_set("sensor.test_state", STATE_OFF)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.test").state == STATE_OFF
+
+    hass.states.async_set("sensor.test_state", STATE_ON)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.test").state == STATE_OFF
+
+    freezer.tick(timedelta(seconds=5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.test").state == STATE_ON
+
+
 @pytest.mark.parametrize("count", [1])
 @pytest.mark.parametrize(
     ("config", "domain", "entity_id"),